@@ -2,8 +2,10 @@
 
 import logging
 import time
+from functools import partial
 
 from odoo import api, fields, models
+from odoo.tools import SQL
 from dateutil.relativedelta import relativedelta
 
 from ..utils import exceptions
@@ -11,6 +13,9 @@ from ..utils import exceptions
 LOG_ORIGIN = __name__
 _logger = logging.getLogger(LOG_ORIGIN)
 
+LOG_BUFFER_KEY = 'api_manager.logger.buffer'
+LOG_BUFFER_SIZE = 100
+
 
 class APILogger(models.Model):
     """API Logs of incomming and outgoing traffic."""
@@ -55,7 +60,7 @@ class APILogger(models.Model):
         with self.pool.cursor() as new_cr:
             new_env = api.Environment(new_cr, self.env.uid, self.env.context)
             new_self = self.with_env(new_env)
-            callable_method = self._get_method(new_self.env, method)
+            callable_method = new_self._get_method(new_self.env, method)
             res = callable_method(*args, **kwargs)
             new_self._commit_changes()  # pylint: disable=W0212
         _logger.debug("Closing isolated transaction for logging.")  # Log used method
@@ -65,7 +70,7 @@ class APILogger(models.Model):
     def _commit_changes(self, attempt=1):
         """Commit Changes to database."""
         try:
-            _logger.info("Committing API Log")  # Log used method
+            _logger.debug("Committing API Log")  # Log used method
             self.env.cr.commit()  # pylint:disable=E8102
         except Exception as error:  # pylint:disable=W0703
             _logger.error("Committing attempt %s of API Log failed with error: %s", attempt, error)
@@ -75,15 +80,77 @@ class APILogger(models.Model):
                 return
             self.env.cr.rollback()
         else:
-            _logger.info("Committing API Log was success!")  # Log used method
+            _logger.debug("Committing API Log was success!")  # Log used method
 
     def write(self, vals):  # pylint:disable=W8106
         """Override to use new environment."""
         return self._preprocess('write', vals)
 
-    def create(self, values):  # pylint:disable=W8106
+    @api.model_create_multi
+    def create(self, vals_list):  # pylint:disable=W8106
         """Override to use new environment."""
-        return self._preprocess('create', values)
+        return self._preprocess('create', vals_list)
+
+    @api.model
+    def create_deferred(self, values):
+        """
+        Queue log values to be created in one batch when current transaction ends.
+
+        Logs are written in isolated transaction when current cursor is committed or rolled back
+        (closing cursor rolls back too), or as soon as the queue reaches `LOG_BUFFER_SIZE` entries.
+        Use :func:`flush_deferred` for logs that must be written right away.
+
+        :param values: Values of new log
+        """
+        cr = self.env.cr
+        buffer = cr.postrollback.data.get(LOG_BUFFER_KEY)
+        if buffer is None:
+            buffer = cr.postrollback.data[LOG_BUFFER_KEY] = []
+            cr.postrollback.add(partial(self._flush_buffer_hook, buffer))
+        if LOG_BUFFER_KEY not in cr.postcommit.data:
+            cr.postcommit.data[LOG_BUFFER_KEY] = buffer
+            cr.postcommit.add(partial(self._flush_buffer_hook, buffer))
+        buffer.append(values)
+        if len(buffer) >= LOG_BUFFER_SIZE:
+            self._flush_buffer(buffer)
+
+    @api.model
+    def flush_deferred(self):
+        """Create all queued logs of current transaction immediately."""
+        buffer = self.env.cr.postrollback.data.get(LOG_BUFFER_KEY)
+        if buffer:
+            self._flush_buffer(buffer)
+
+    def _flush_buffer_hook(self, buffer):
+        """
+        Create queued logs from post-commit/post-rollback hook.
+
+        Errors are only logged, the transaction is already over and remaining hooks must run.
+
+        :param buffer: List of queued log values, emptied by this method
+        """
+        count = len(buffer)
+        try:
+            self._flush_buffer(buffer)
+        except Exception:  # pylint:disable=W0703
+            _logger.exception("Creating %s queued API Logs failed", count)
+
+    def _flush_buffer(self, buffer):
+        """
+        Create queued logs with single create call in new cursor.
+
+        Called also from post-commit/post-rollback hooks, when the current cursor
+        can't be used for writing anymore.
+
+        :param buffer: List of queued log values, emptied by this method
+        """
+        if not buffer:
+            return
+        vals_list = buffer[:]
+        buffer.clear()
+        with self.pool.cursor() as new_cr:  # Committed on exit
+            new_self = self.with_env(self.env(cr=new_cr))
+            new_self._get_method(new_self.env, 'create')(vals_list)
 
     def _get_method(self, env, method_name):
         """
@@ -106,7 +173,13 @@ class APILogger(models.Model):
 
     def _clear_logs(self):
         """Clear logs older then one month."""
-        for log in self.search(
-            [('created_at', '<', fields.Datetime.now() - relativedelta(months=1))]
-        ):
-            log.unlink()
+        self.flush_model(['created_at'])
+        self.env.cr.execute(
+            SQL(
+                "DELETE FROM %s WHERE created_at < %s",
+                SQL.identifier(self._table),
+                fields.Datetime.now() - relativedelta(months=1),
+            )
+        )
+        _logger.debug("Cleared %s API Logs.", self.env.cr.rowcount)
+        self.invalidate_model()
@@ -1,7 +1,11 @@
 """Module for managing API Providers."""
 
-from odoo import _, api, fields, models
-from odoo.exceptions import ValidationError
+from typing import Union
+
+from odoo import api, fields, models, tools
+
+# Fields read by cached provider lookups
+CACHED_FIELDS = {'internal_reference'}
 
 
 class APIProvider(models.Model):
@@ -56,16 +60,63 @@ class APIProvider(models.Model):
     token = fields.Char(store=True, default=None)
     dynamic_token = fields.Boolean("Is Dynamic Token")
     rel_companies = fields.Many2many('res.company', string="Related Companies")
+    enable_request_logging = fields.Boolean(
+        "Log Requests",
+        default=True,
+        help="Store outgoing requests of this provider in API Logs.",
+    )
+
+    _sql_constraints = [
+        (
+            'server_domain_no_trailing_slash',
+            "CHECK (right(server_domain, 1) <> '/')",
+            "Server Domain cannot end with '/' character!",
+        ),
+        (
+            'internal_reference_uniq',
+            'unique (internal_reference)',
+            "Internal Reference must be unique!",
+        ),
+    ]
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        """Clear cached provider lookups."""
+        self.env.registry.clear_cache()
+        return super().create(vals_list)
+
+    def write(self, vals):
+        """Clear cached provider lookups, if they are affected."""
+        if CACHED_FIELDS.intersection(vals):
+            self.env.registry.clear_cache()
+        return super().write(vals)
+
+    def unlink(self):
+        """Clear cached provider lookups."""
+        self.env.registry.clear_cache()
+        return super().unlink()
+
+    @api.model
+    def get_by_reference(self, internal_reference: str):
+        """
+        Return provider with given internal reference.
+
+        Lookup is cached, so repeated calls don't search database.
+        Internal reference is unique, see `internal_reference_uniq` constraint.
+
+        :param internal_reference: Internal reference of provider
+
+        :return: Provider record or empty recordset
+        """
+        return self.browse(self._get_id_by_reference(internal_reference))
+
+    @tools.ormcache('internal_reference')
+    def _get_id_by_reference(self, internal_reference: str) -> Union[int, bool]:
+        """Return ID of provider with given internal reference or False."""
+        return self.sudo().search([('internal_reference', '=', internal_reference)], limit=1).id
 
     @api.depends('server_domain', 'server_scheme')
     def _compute_server_url(self):
         """Compute full url."""
         for record in self:
             record.server_url = f"{record.server_scheme}://{record.server_domain}"
-
-    @api.constrains('server_domain')
-    def _check_server_domain(self):
-        """Validate server domain."""
-        for provider in self:
-            if provider.server_domain[-1] == "/":
-                raise ValidationError(_("Server Domain cannot end with '/' character!"))
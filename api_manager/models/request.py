@@ -1,21 +1,97 @@
 """Module for managing API Requests."""
 __version__ = "1.2"
 
-import json
+import copy
 import logging
 import re
 import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
-from urllib.parse import quote_plus as url_encode
+from functools import lru_cache
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import quote, urlencode
 
 import requests
-from odoo import _, api, fields, models, SUPERUSER_ID
+from odoo import _, api, fields, models, tools, SUPERUSER_ID
 from odoo.exceptions import ValidationError
 
+from ..utils.serialization import JSONDecodeError, json_dumps, json_loads
+
 LOG_ORIGIN = __name__
 _logger = logging.getLogger(LOG_ORIGIN)
 
+# Sessions are shared between requests of the same provider, so keep-alive
+# connections and urllib3 connection pool survive across API calls.
+_SESSIONS: Dict[Tuple[str, str], requests.Session] = {}
+
+# This doesn't retry on status codes, only if request doesn't reach the server!
+_RETRIES = 5
+_RETRY = requests.adapters.Retry(
+    total=_RETRIES, read=_RETRIES, connect=_RETRIES, backoff_factor=0.1
+)
+_HTTP_ADAPTER = requests.adapters.HTTPAdapter(
+    max_retries=_RETRY, pool_connections=10, pool_maxsize=50
+)
+
+# States of requests are stored on the cursor, keyed by record ids, so they belong
+# to one database and are dropped together with the transaction.
+# Only `_REQUEST_STATE_LIMIT` most recently used states are kept per cursor.
+_REQUEST_STATE_LIMIT = 32
+
+# Replacement of credentials in logs
+_REDACTED = "***"
+
+
+_EMPTY_REQUEST_STATE = {
+    'headers': None,
+    'query_args': None,
+    'auth_method': None,
+    'data': "",
+    'query': "",
+    'cookies': None,
+    'response': None,
+    'error': None,
+    'message': None,
+    'status_code': None,
+    'success': False,
+    'decoded': None,
+}
+
+
+def _new_request_state() -> dict:
+    """Return new empty request state."""
+    state = _EMPTY_REQUEST_STATE.copy()
+    state['headers'] = {}
+    state['query_args'] = {}
+    return state
+
+
+# Methods of APIRequest applying authentication by (authentication_method, token_method)
+AUTH_HANDLERS = {
+    ('basic', None): '_auth_basic',
+    ('digest', None): '_auth_digest',
+    ('bearer_token', None): '_auth_bearer_token',
+    ('api_token', 'header'): '_auth_api_token_header',
+    ('api_token', 'query_arg'): '_auth_api_token_query_arg',
+}
+
+# Keyword of requests.request used for body, by content type
+DATA_KEYS = {'application/json': 'json'}
+
+PARAM_PATTERN = re.compile(r'{[^}]*}')
+
+
+@lru_cache(maxsize=256)
+def _get_params_pattern(keys: Tuple[str, ...]) -> re.Pattern:
+    """
+    Return compiled pattern matching any of literal parameter keys.
+
+    :param keys: Parameter keys in order of priority
+
+    :return: Compiled alternation pattern
+    """
+    return re.compile("|".join(map(re.escape, keys)))
+
 
 # pylint: disable=R0902
 class APIRequest(models.Model):
@@ -27,19 +103,19 @@ class APIRequest(models.Model):
 
     name = fields.Char(store=True)
 
-    @api.depends('provider', 'method')
+    @api.depends('provider.internal_reference', 'method', 'name')
     def _compute_display_name(self):
         """Compute full url."""
         for record in self:
             name = f"[{record.provider.internal_reference}][{record.method}] {record.name}"
             record.display_name = name
 
-    display_name = fields.Char("Name", compute="_compute_display_name")
+    display_name = fields.Char("Name", compute="_compute_display_name", store=True)
     url_path = fields.Char("Request URL Path", required=True)
     provider = fields.Many2one(
         'api_manager.provider', string='API Provider', ondelete='restrict', required=True
     )
-    record_path = fields.Char(compute='_compute_record_path')
+    record_path = fields.Char(compute='_compute_derived_fields', store=True)
     method = fields.Selection(
         selection=[
             ('GET', "GET"),
@@ -97,30 +173,39 @@ class APIRequest(models.Model):
             ('video/webm', 'video/webm'),
         ],
     )
-    parametrized_url = fields.Boolean("Parametrized", compute='_compute_parametrized', store=True)
+    parametrized_url = fields.Boolean(
+        "Parametrized", compute='_compute_derived_fields', store=True
+    )
+
+    def _get_request_states(self) -> Dict[tuple, dict]:
+        """Get or create request states of current transaction, keyed by record ids."""
+        cr = self.env.cr
+        try:
+            return cr._api_request_states
+        except AttributeError:
+            states = cr._api_request_states = {}
+            return states
 
     def _get_request_state(self):
-        """Get or create request state dictionary."""
-        if not hasattr(self.env, '_api_request_state'):
-            self.env._api_request_state = {}
-
-        key = id(self)
-        if key not in self.env._api_request_state:
-            self.env._api_request_state[key] = {
-                'headers': {},
-                'query_args': {},
-                'auth_method': None,
-                'data': "",
-                'query': "",
-                'parametrized': False,
-                'cookies': None,
-                'response': None,
-                'error': None,
-                'message': None,
-                'status_code': None,
-                'success': False,
-            }
-        return self.env._api_request_state[key]
+        """
+        Get or create request state dictionary of current record.
+
+        Only `_REQUEST_STATE_LIMIT` most recently used states are kept in a transaction.
+        State of a request not used since is evicted, reading it returns a new empty state.
+        """
+        state = self._get_request_states().get(self._ids)
+        if state is None:
+            return self.clear()
+        self._set_request_state(state)  # Mark as most recently used
+        return state
+
+    def _set_request_state(self, state: dict):
+        """Store request state dictionary of current record, evicting the least recently used."""
+        states = self._get_request_states()
+        states.pop(self._ids, None)
+        states[self._ids] = state
+        if len(states) > _REQUEST_STATE_LIMIT:
+            del states[next(iter(states))]
 
     @property
     def headers(self):
@@ -159,8 +244,11 @@ class APIRequest(models.Model):
 
     @property
     def message(self):
-        """Getter for message."""
-        return self._get_request_state()['message']
+        """Getter for message, response body is decoded to text only on first access."""
+        state = self._get_request_state()
+        if state['message'] is None and state['response'] is not None:
+            state['message'] = state['response'].text
+        return state['message']
 
     @message.setter
     def message(self, value):
@@ -187,17 +275,12 @@ class APIRequest(models.Model):
         """Setter for success."""
         self._get_request_state()['success'] = value
 
-    @api.depends('provider', 'name')
-    def _compute_record_path(self) -> None:
-        """Compute nested name for record from provider name."""
+    @api.depends('provider.name', 'name', 'url_path')
+    def _compute_derived_fields(self) -> None:
+        """Compute nested name for record from provider name and if url path is parametrized."""
         for request in self:
             request.record_path = f"{request.provider.name} / {request.name}"
-
-    @api.depends('url_path')
-    def _compute_parametrized(self) -> None:
-        """Compute nested name for record from provider name."""
-        for request in self:
-            request.parametrized_url = bool(re.search(r'{[^}]*}', request.url_path))
+            request.parametrized_url = bool(PARAM_PATTERN.search(request.url_path or ""))
 
     @api.constrains('payload')
     def _check_valid_json(self) -> None:
@@ -211,59 +294,139 @@ class APIRequest(models.Model):
         for request in self:
             if request.payload:
                 try:
-                    json.loads(request.payload)
+                    json_loads(request.payload)
                 except ValueError as exc:
                     _logger.error("Payload is not valid JSON!")
                     raise ValidationError(_("Payload is not valid JSON!")) from exc
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        """Clear cached request lookups."""
+        self.env.registry.clear_cache()
+        return super().create(vals_list)
+
+    def write(self, vals):
+        """Clear cached request lookups, if they are affected."""
+        if 'name' in vals:
+            self.env.registry.clear_cache()
+        return super().write(vals)
+
+    def unlink(self):
+        """Clear cached request lookups."""
+        self.env.registry.clear_cache()
+        return super().unlink()
+
+    @api.model
+    def get_by_name(self, name: str):
+        """
+        Return request with given name.
+
+        Lookup is cached, so repeated calls don't search database.
+        Name is expected to be unique, as it's not enforced (names may repeat
+        across providers), the oldest request is returned and a warning is logged.
+
+        :param name: Name of request
+
+        :return: Request record or empty recordset
+        """
+        return self.browse(self._get_id_by_name(name))
+
+    @tools.ormcache('name')
+    def _get_id_by_name(self, name: str) -> Union[int, bool]:
+        """Return ID of request with given name or False."""
+        requests_ = self.sudo().search([('name', '=', name)], order='id', limit=2)
+        if len(requests_) > 1:
+            _logger.warning("Multiple requests named %r, using request %s", name, requests_[0].id)
+        return requests_[:1].id
+
     # --- PREPARE REQUEST --- #
 
-    def _set_authentication(self) -> Optional[requests.auth.AuthBase]:
-        """Return authentication method or set appropriate headers."""
-        state = self._get_request_state()
-        auth_method = self.provider.authentication_method
-        if auth_method == 'basic':
-            vals = self._get_auth_kv(['username', 'password'])
-            return requests.auth.HTTPBasicAuth(vals[0], vals[1])
-        if auth_method == 'digest':
-            vals = self._get_auth_kv(['username', 'password'])
-            return requests.auth.HTTPDigestAuth(vals[0], vals[1])
-        if auth_method == 'bearer_token':
-            state['headers']['Authorization'] = 'Bearer ' + self._get_auth_kv(['token'])[0]
-        if auth_method == 'api_token' and self.provider.token_method == 'header':
-            state['headers'][self.provider.key] = self._get_auth_kv(['value'])[0]
-        if auth_method == 'api_token' and self.provider.token_method == 'query_arg':
-            state['query_args'][self.provider.key] = self._get_auth_kv(['value'])[0]
-        return None
-
-    def _get_auth_kv(self, values: list) -> list:
+    def _set_authentication(self, state: dict, provider) -> Optional[requests.auth.AuthBase]:
+        """
+        Return authentication method or set appropriate headers.
+
+        :param state: Request state
+        :param provider: Provider of request
+        """
+        auth_method = provider.authentication_method
+        token_method = provider.token_method if auth_method == 'api_token' else None
+        handler = AUTH_HANDLERS.get((auth_method, token_method))
+        if handler is None:
+            return None
+        return getattr(self, handler)(state, provider)
+
+    def _auth_basic(self, _state: dict, provider) -> requests.auth.AuthBase:
+        """Return HTTP Basic authentication."""
+        vals = self._get_auth_kv(provider, ['username', 'password'])
+        return requests.auth.HTTPBasicAuth(vals[0], vals[1])
+
+    def _auth_digest(self, _state: dict, provider) -> requests.auth.AuthBase:
+        """Return HTTP Digest authentication."""
+        vals = self._get_auth_kv(provider, ['username', 'password'])
+        return requests.auth.HTTPDigestAuth(vals[0], vals[1])
+
+    def _auth_bearer_token(self, state: dict, provider) -> None:
+        """Set bearer token header."""
+        state['headers']['Authorization'] = 'Bearer ' + self._get_auth_kv(provider, ['token'])[0]
+
+    def _auth_api_token_header(self, state: dict, provider) -> None:
+        """Set API token header."""
+        state['headers'][provider.key] = self._get_auth_kv(provider, ['value'])[0]
+
+    def _auth_api_token_query_arg(self, state: dict, provider) -> None:
+        """Set API token query argument."""
+        state['query_args'][provider.key] = self._get_auth_kv(provider, ['value'])[0]
+
+    def _get_auth_kv(self, provider, values: list) -> tuple:
         """
         Get authentication values for request based on company and provider.
 
         Authentication values such a token, username, password are stored in model api_manager.request_parameter.
         In case it doesn't exist, return default value stored on provider model.
 
+        :param provider: Provider of request
         :param values: list of authentication fields
 
-        :return: list of credentials
+        :return: tuple of credentials
         """
+        params = self._get_auth_params(provider.id, self.env.company.id, tuple(values))
+        return tuple(
+            getattr(provider, val) if param is None else param for val, param in zip(values, params)
+        )
+
+    @tools.ormcache('provider_id', 'company_id', 'values')
+    def _get_auth_params(self, provider_id: int, company_id: int, values: tuple) -> tuple:
+        """
+        Get values of request parameters overriding authentication fields of provider.
+
+        Result is cached, cache is cleared whenever request parameters change.
+        Provider fields are not cached, so e.g. refreshing token doesn't clear the cache.
+
+        :param provider_id: ID of provider
+        :param company_id: ID of company
+        :param values: authentication fields
+
+        :return: tuple of parameter values, None for fields without parameter
+        """
+        rel_kvs = self.env['api_manager.request_parameter'].search(
+            [
+                ('provider', '=', provider_id),
+                ('key', 'in', list(values)),
+                ('company_id', '=', company_id),
+            ]
+        )
+        rel_kvs_by_key = {rel_kv.key: rel_kv for rel_kv in rel_kvs}
         res = []
         for val in values:
-            rel_kv = self.env['api_manager.request_parameter'].search(
-                [
-                    ('provider', '=', self.provider.id),
-                    ('key', '=', val),
-                    ('company_id', '=', self.env.company.id),
-                ]
-            )
+            rel_kv = rel_kvs_by_key.get(val)
             if rel_kv:
                 if not rel_kv.value:
                     msg = f"Value is not set for key/value {rel_kv.id}"
                     raise ValidationError(_(msg))
                 res.append(rel_kv.value)
             else:
-                res.append(getattr(self.provider, val))
-        return res
+                res.append(None)
+        return tuple(res)
 
     @staticmethod
     def _get_parametrized_query(query, params: Dict[str, str]) -> str:
@@ -275,68 +438,84 @@ class APIRequest(models.Model):
 
         :return: Modified query
         """
-        for key, value in params.items():
-            query = re.sub(key, value, query)
-        return query
+        if not params:
+            return query
+        pattern = _get_params_pattern(tuple(params))
+        return pattern.sub(lambda match: params[match.group(0)], query)
 
-    def _get_query_wth_args(self, query, args: Dict[str, str]) -> str:
+    @staticmethod
+    def _get_query_wth_args(state: dict, query, args: Dict[str, str]) -> str:
         """
         Replace parameters in query path with dictionary data.
 
+        :param state: Request state
         :param query: Original query
         :param params: Data to replace 'key' with 'value' in query
 
         :return: Modified query
         """
-        state = self._get_request_state()
         args = {**args, **state['query_args']}
-        for key, value in args.items():
-            query += ("&" if state['parametrized'] else "?") + key + "=" + value
-            state['parametrized'] = True
-        return query
+        if not args:
+            return query
+        separator = "&" if "?" in query else "?"
+        return f"{query}{separator}{urlencode(args, doseq=True)}"
 
     def _get_payload(self, data: Union[Dict, List]) -> Union[dict, list]:
         """
         Prepare request payload data.
 
+        Values of the cached payload override are copied, so callers may modify returned data.
+
         :param data: Hardcoded data from caller
         :return: Union[Dict, List]
         """
-        override = self.payload or "{}"
-        payload = json.loads(override)
+        payload = self._get_parsed_payload()
         if isinstance(data, list):  # pylint:disable=R1705
-            payload_list = []
-            for item in data:
-                payload_list.append({**item, **payload})
-            return payload_list
+            return [{**item, **copy.deepcopy(payload)} for item in data]
         else:
-            return {**data, **payload}
+            return {**data, **copy.deepcopy(payload)}
 
-    def _prepare_headers(self, headers: dict):
+    @tools.ormcache('self.payload')
+    def _get_parsed_payload(self) -> dict:
+        """
+        Return parsed payload override, cached for each payload value.
+
+        Cache doesn't depend on record, so in-memory requests don't fill it with new keys.
+
+        Returned dictionary is shared, use :func:`_get_payload` to get a copy.
+
+        :return: Parsed payload
+        """
+        return json_loads(self.payload or "{}")
+
+    def _prepare_headers(self, state: dict, headers: dict):
         """
         Prepare headers with content type and custom data.
 
+        :param state: Request state
         :param headers: Dictionary containing new headers
         """
-        state = self._get_request_state()
         if not state['headers'].get('Content-Type') and self.content_type:
             state['headers']['Content-Type'] = self.content_type
         for key, value in headers.items():
             state['headers'][key] = value
 
-    def _prepare_url(self, params, args, encode=False):
+    def _prepare_url(self, state: dict, provider, params, args, encode=False):
         """
         Prepare url with new parameters and arguments data.
 
+        :param state: Request state
+        :param provider: Provider of request
         :param params: Dictionary containing new parameters
         :param args: Dictionary containing new arguments
-        :param args: Should url be encoded by basic library?
+        :param encode: Should path parameters be encoded by basic library?
         """
-        state = self._get_request_state()
-        query = f"{self.provider.server_url}{self.url_path}"
-        query = self._get_parametrized_query(query, params)
-        query = self._get_query_wth_args(query, args)
-        state['query'] = url_encode(query) if encode else query
+        query = f"{provider.server_url}{self.url_path}"
+        if self.parametrized_url and params:
+            if encode:
+                params = {key: quote(value, safe='') for key, value in params.items()}
+            query = self._get_parametrized_query(query, params)
+        state['query'] = self._get_query_wth_args(state, query, args)
 
     def get_request_data(self, **kwargs) -> Dict[str, Any]:
         """
@@ -354,16 +533,20 @@ class APIRequest(models.Model):
 
         :return: Request data
         """
-        self.clear()  # Очищаем состояние перед новым запросом
-        state = self._get_request_state()
+        state = self.clear()
 
-        state['auth_method'] = self._set_authentication()
-        self._prepare_headers(kwargs.get('headers', {}))
+        provider = self.provider
+        state['auth_method'] = self._set_authentication(state, provider)
+        self._prepare_headers(state, kwargs.get('headers', {}))
         self._prepare_url(
-            kwargs.get('params', {}), kwargs.get('args', {}), kwargs.get('urlsafe', False)
+            state,
+            provider,
+            kwargs.get('params', {}),
+            kwargs.get('args', {}),
+            kwargs.get('urlsafe', False),
         )
         state['data'] = self._get_payload(kwargs.get('data', {}))
-        data_key = 'json' if self.content_type == 'application/json' else 'data'
+        data_key = DATA_KEYS.get(self.content_type, 'data')
         request_args = {
             'method': self.method.lower(),
             'auth': state['auth_method'],
@@ -377,22 +560,44 @@ class APIRequest(models.Model):
 
     # --- PROCESS REQUEST --- #
 
+    @staticmethod
+    def _build_session(scheme: str) -> requests.Session:
+        """
+        Create new session with retrying adapter mounted on provider scheme.
+
+        Session is shared by all users and companies, so cookies set by the server
+        are never stored to not leak them between unrelated API calls.
+
+        :param scheme: URL scheme of provider
+
+        :return: Configured session
+        """
+        session = requests.Session()
+        # Same prefix as the default 'http://'/'https://' adapter, mount() replaces it
+        session.mount(f"{scheme}://", _HTTP_ADAPTER)
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        return session
+
+    def get_session(self) -> requests.Session:
+        """
+        Return session shared by all requests of the provider.
+
+        :return: Session with pooled connections
+        """
+        provider = self.provider
+        key = (provider.server_scheme, provider.server_url)
+        session = _SESSIONS.get(key)
+        if session is None:
+            session = _SESSIONS.setdefault(key, self._build_session(key[0]))
+        return session
+
     def _send_request(self, request_data: Dict[str, Any]):
         """
         Send request with prepared data.
 
         :param request_data: Request Data
         """
-        with requests.Session() as session:
-            retries = 5
-            # This doesn't retry on status codes, only if request doesn't reach the server!
-            retry = requests.adapters.Retry(
-                total=retries, read=retries, connect=retries, backoff_factor=0.1
-            )
-            http_adapter = requests.adapters.HTTPAdapter(max_retries=retry)
-            session.mount(self.provider.server_scheme, http_adapter)
-            self.response = session.request(**request_data)
-            self.message = self.response.text
+        self.response = self.get_session().request(**request_data)
 
     # def send_request(self, **kwargs) -> Any:
     #     """
@@ -432,59 +637,89 @@ class APIRequest(models.Model):
     def send_request(self, **kwargs) -> Any:
         """
         Send request and return response.
+
+        Works also on in-memory requests created by `new()`, so ad-hoc requests
+        don't need to be created and unlinked in database.
         """
 
-        self.log_request(LOG_ORIGIN)
-        request_data = self.get_request_data(**kwargs)
+        while True:
+            request_data = self.get_request_data(**kwargs)
+            self.log_request(LOG_ORIGIN)
+            try:
+                self._send_request(request_data)
+                if _logger.isEnabledFor(logging.DEBUG):
+                    _logger.debug(
+                        "Request %s: %s, response: %s",
+                        self.name,
+                        self._redact_request_data(request_data),
+                        {
+                            "status_code": self.response.status_code,
+                            "headers": dict(self.response.headers),
+                            "body": self.message[:1000],
+                        },
+                    )
+                self._set_status_code()
+                self.success = self.status_code // 200 == 1
+            except (requests.exceptions.HTTPError, requests.exceptions.Timeout) as error:
+                _logger.debug("Request %s failed: %s", self.name, error)
+                if self._prepare_retry(kwargs):
+                    continue
+            except requests.exceptions.RequestException as error:
+                # Any other request error. Raise Exceptions manually after send_request call!
+                _logger.debug("Request %s failed: %s", self.name, error)
+                self._set_error(error)
+            finally:
+                if not self.success:
+                    # Caller will likely raise, write the log before transaction is aborted
+                    self.env['api_manager.logger'].sudo().flush_deferred()
+
+            return self._get_return_value(kwargs.get('return_type', 'success'))
+
+    def _redact_request_data(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Return copy of request data without credentials, to be logged.
 
-        # Посмотреть какие данные собрали для запроса
-        print("=== REQUEST DATA ===")
-        print("URL:", request_data.get("url"))
-        print("METHOD:", request_data.get("method"))
-        print("HEADERS:", request_data.get("headers"))
-        print("PARAMS:", request_data.get("params"))
-        print("ARGS:", request_data.get("args"))
-        print("DATA:", request_data.get("data"))
-        print("JSON:", request_data.get("json"))
+        Authentication object, `Authorization` header and API token header
+        or query argument are replaced.
 
-        try:
-            self._send_request(request_data)
+        :param request_data: Request Data
 
-            print("=== RESPONSE ===")
-            if self.response:  # Используем self.response вместо response
-                print("Status Code:", self.response.status_code)
-                print("Response Body:", self.response.text[:1000])  # первые 1000 символов
-                print("Response Headers:", dict(self.response.headers))
+        :return: Redacted request data
+        """
+        url = request_data['url']
+        for key, value in self._get_request_state()['query_args'].items():
+            url = url.replace(urlencode({key: value}), urlencode({key: _REDACTED}))
+        return {
+            **request_data,
+            'url': url,
+            'auth': request_data['auth'] and _REDACTED,
+            'headers': self._redact_headers(request_data['headers']),
+        }
 
-                # Попробовать распарсить JSON
-                try:
-                    json_data = self.response.json()
-                    print("Response JSON:", json_data)
-                except:
-                    print("Response is not JSON")
-            else:
-                print("No response received")
+    def _redact_headers(self, headers: Dict[str, str]) -> Dict[str, str]:
+        """
+        Return copy of headers with `Authorization` and API token header replaced.
 
-            self._set_status_code()
-            self.success = self.status_code // 200 == 1
-        except (requests.exceptions.HTTPError, requests.exceptions.Timeout) as error:
-            print("HTTP/Timeout error:", error)
-            result = self._retry_request(**kwargs)
-            if result is not None:
-                return result
-        except requests.exceptions.ConnectionError as error:
-            print("Connection error:", error)
-            self._set_error(error)
-        except requests.exceptions.RequestException as error:
-            print("Other request error:", error)
-            self._set_error(error)
+        :param headers: Request headers
 
-        return self._get_return_value(kwargs.get('return_type', 'success'))
+        :return: Redacted headers
+        """
+        provider = self.provider
+        secret_headers = {'authorization'}
+        if provider.authentication_method == 'api_token' and provider.key:
+            secret_headers.add(provider.key.lower())
+        return {
+            key: _REDACTED if key.lower() in secret_headers else value
+            for key, value in headers.items()
+        }
 
-    def _retry_request(self, **kwargs):
+    def _prepare_retry(self, kwargs: dict) -> bool:
         """
-        Retry request based on status code and available attempts.
+        Decide if request should be retried based on status code and available attempts.
 
+        Waits before next attempt and increases attempt index in `kwargs`.
+
+        :param kwargs: Keyword arguments of :func:`send_request`
         :keyword retry_on_error: bool: True if request should by retried
         :keyword attempt: int: Current retry attempt index.
         :keyword max_attempts: int: Maximum number of attempts to retry.
@@ -492,23 +727,23 @@ class APIRequest(models.Model):
         :keyword backoff_factor: int: See:
             https://urllib3.readthedocs.io/en/stable/reference/urllib3.util.html.
 
-        :return: None if request shouldn't be retried else see :func:`send_request`.
+        :return: True if request should be sent again
         """
         if not kwargs.get('retry_on_error', False):
-            return None
+            return False
 
         attempt = kwargs.get('attempt', 1)
         max_attempts = kwargs.get('max_attempts', 5)
         if attempt > max_attempts:
-            return None
+            return False
         whitelisted_codes = kwargs.get('retry_on_http_error', tuple(range(400, 600)))
         if self.status_code not in whitelisted_codes:
-            return None
+            return False
 
         backoff_factor = kwargs.get("backoff_factor", 1)
         time.sleep(backoff_factor * (2 ** (attempt - 1)))  # Wait before next retry
         kwargs["attempt"] = attempt + 1
-        return self.send_request(**kwargs)
+        return True
 
     # --- PROCESS RESPONSE --- #
 
@@ -530,54 +765,75 @@ class APIRequest(models.Model):
         """
         Return json response.
 
+        Response body is parsed only once, following calls return cached data.
+
         :return: Dictionary representing JSON data or empty dict
         """
         state = self._get_request_state()
+        if state['decoded'] is not None:
+            return state['decoded']
         try:
-            return self.response.json()
-        except json.decoder.JSONDecodeError:
+            state['decoded'] = self._load_response_json(self.response)
+        except (JSONDecodeError, UnicodeDecodeError):
             _logger.debug(
                 "Response is not JSON: %s",
                 {
                     "request_name": self.name,
                     "url": state['query'],
-                    "response": self.response.text,
+                    "response": self.message,
                 },
             )
-        return {}
+            state['decoded'] = {}
+        return state['decoded']
+
+    @staticmethod
+    def _load_response_json(response: requests.Response) -> Any:
+        """
+        Parse JSON response body.
+
+        Raw bytes are parsed directly unless the response declares other encoding
+        than UTF-8, or the bytes can't be parsed (BOM, undeclared encoding).
+        Then the body decoded to text by requests is parsed instead.
+
+        :param response: Response to parse
+
+        :raises JSONDecodeError: if body is not valid JSON
+        :return: Deserialized data
+        """
+        encoding = (response.encoding or 'utf-8').lower().replace('_', '-')
+        if encoding in ('utf-8', 'utf8'):
+            try:
+                return json_loads(response.content)
+            except (JSONDecodeError, UnicodeDecodeError):
+                pass
+        return json_loads(response.text.lstrip('\ufeff'))
 
     def log_request(self, origin=None):
         """Log outgoing requests to api_manager.logger."""
+        if not self.provider.enable_request_logging:
+            return
         state = self._get_request_state()
-        self.env['api_manager.logger'].with_user(SUPERUSER_ID).sudo().create(
+        self.env['api_manager.logger'].with_user(SUPERUSER_ID).sudo().create_deferred(
             {
                 'created_at': datetime.now(),
                 'origin': origin or LOG_ORIGIN,
                 'direction': "outgoing",
-                'data': {
-                    "headers": state['headers'],
-                    "cookies": state['cookies'],
-                    "data": state['data'],
-                },
+                'data': json_dumps(
+                    {
+                        "headers": self._redact_headers(state['headers']),
+                        "cookies": state['cookies'],
+                        "data": state['data'],
+                    }
+                ),
             }
         )
 
-    def clear(self):
-        """Clear all cached data in current instance."""
-        if hasattr(self.env, '_api_request_state'):
-            key = id(self)
-            if key in self.env._api_request_state:
-                self.env._api_request_state[key] = {
-                    'headers': {},
-                    'query_args': {},
-                    'auth_method': None,
-                    'data': "",
-                    'query': "",
-                    'parametrized': False,
-                    'cookies': None,
-                    'response': None,
-                    'error': None,
-                    'message': None,
-                    'status_code': None,
-                    'success': False,
-                }
\ No newline at end of file
+    def clear(self) -> dict:
+        """
+        Clear all cached data of current request.
+
+        :return: New empty request state
+        """
+        state = _new_request_state()
+        self._set_request_state(state)
+        return state
@@ -4,7 +4,10 @@ from collections import defaultdict
 from itertools import product
 from typing import Dict, Generator
 
-from odoo import fields, models
+from odoo import api, fields, models
+
+# Fields read by cached authentication values of requests
+CACHED_FIELDS = {'provider', 'key', 'value', 'company_id'}
 
 
 class APIRequestParameter(models.Model):
@@ -22,6 +25,23 @@ class APIRequestParameter(models.Model):
         ('key_val_uniq', 'unique (provider, key, company_id)', "This combination exists already!"),
     ]
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        """Clear cached authentication values."""
+        self.env.registry.clear_cache()
+        return super().create(vals_list)
+
+    def write(self, vals):
+        """Clear cached authentication values, if they are affected."""
+        if CACHED_FIELDS.intersection(vals):
+            self.env.registry.clear_cache()
+        return super().write(vals)
+
+    def unlink(self):
+        """Clear cached authentication values."""
+        self.env.registry.clear_cache()
+        return super().unlink()
+
     def get_groups_by_key(self) -> Dict[str, set]:
         """Return grouped recordset by keys without duplicate values."""
         grouped = defaultdict(set)
@@ -0,0 +1,48 @@
+"""JSON serialization helpers."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+JSONDecodeError = json.JSONDecodeError
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Deserialize JSON document, using orjson when available.
+
+    :param data: JSON document
+
+    :raises JSONDecodeError: if document is not valid JSON
+    :return: Deserialized data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(data: Any) -> str:
+    """
+    Serialize data to JSON document, using orjson when available.
+
+    Objects unknown to the serializer are converted with :func:`str`.
+    Never raises, data that can't be serialized (e.g. too big integers for orjson,
+    keys of unsupported type) is serialized by standard library or as its :func:`repr`.
+
+    :param data: Data to serialize
+
+    :return: JSON document
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:  # orjson.JSONEncodeError
+            pass
+    try:
+        return json.dumps(data, ensure_ascii=False, default=str)
+    except (TypeError, ValueError):
+        return json.dumps(repr(data), ensure_ascii=False)